@@ -34,9 +34,10 @@
 #   field is not always present in the response.
 #
 
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Any
+from typing import NamedTuple, Optional, Any
 from enum import Enum
 
 
@@ -65,7 +66,7 @@ class MeterType(Enum):
     COLD_AND_WARM_WATER_METER = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Metadata about a single Powerfox device."""
 
@@ -106,8 +107,7 @@ class Device:
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 
-@dataclass
-class Delta:
+class Delta(NamedTuple):
     """A single delta value.
 
     A delta is an aggregated value of the energy consumption or production
@@ -120,12 +120,18 @@ class Delta:
     - full hour: a delta with the timestamp '10 a.m.' means from 10:00 to 10:59
     - quarter hour: '09:15' is from 09:15 to 09:29
     - etc.
+
+    A `NamedTuple` rather than a dataclass, since reports may contain thousands
+    of deltas and tuples are considerably cheaper to create. Consequently,
+    instances are immutable (use `delta._replace(...)` for modified copies),
+    unpack and compare like tuples, and do not work with `dataclasses.replace`,
+    `fields` or `asdict` (use `delta._asdict()` instead).
     """
 
     delta: kWh
     """The aggregated energy consumption or production in kWh."""
-    timestamp: datetime
-    """The start of the interval."""
+    timestamp: Timestamp
+    """The start of the interval, see `timestamp_dt` for a `datetime`."""
     complete: bool
     """True if the value was measured, false if calculated."""
 
@@ -142,8 +148,13 @@ class Delta:
     """Energy consumption or production during low tariff period.
     Only available for 2-tariff meters."""
 
+    @property
+    def timestamp_dt(self) -> datetime:
+        """The start of the interval as local `datetime`."""
+        return datetime.fromtimestamp(self.timestamp)
 
-@dataclass
+
+@dataclass(slots=True)
 class EnergyFigures:
     """List of deltas and metadata about the deltas in a certain time range.
 
@@ -167,9 +178,10 @@ class EnergyFigures:
     sum_currency: int
     max_currency: int
     meter_readings: list[Any]
+    """Raw entries of the API response, neither parsed nor copied."""
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoricalData:
     """Historical energy consumption and production (kWh).
 
@@ -182,6 +194,36 @@ class HistoricalData:
     generation: Optional[EnergyFigures] = None
 
 
+@dataclass(slots=True)
+class EnergyFiguresArray:
+    """Column-oriented variant of the deltas in `EnergyFigures.report_values`.
+
+    Each column is a typed `array.array` with one entry per delta, which avoids
+    creating a `Delta` object per interval. Columns can be wrapped without
+    copying, e.g., `numpy.frombuffer(figures.deltas)`.
+    """
+
+    deltas: array
+    """`Delta.delta` as float (`d`)."""
+    timestamps: array
+    """`Delta.timestamp` as int (`q`)."""
+    complete: array
+    """`Delta.complete` as 0 or 1 (`b`)."""
+    delta_ht: array
+    """`Delta.delta_ht` as float (`d`), NaN if not available."""
+    delta_nt: array
+    """`Delta.delta_nt` as float (`d`), NaN if not available."""
+
+
+@dataclass(slots=True)
+class HistoricalDataArrays:
+    """Column-oriented variant of `HistoricalData`, see `EnergyFiguresArray`."""
+
+    consumption: EnergyFiguresArray
+    feed_in: EnergyFiguresArray
+    generation: Optional[EnergyFiguresArray] = None
+
+
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # Base Operation: retrieve current energy consumption (Watt) and current meter
 # status (Wh or kWh)
@@ -193,7 +235,7 @@ class HistoricalData:
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveMeterReading:
     """Current power consumption.
 
@@ -233,15 +275,23 @@ class LiveMeterReading:
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 
-@dataclass
-class Power:
-    """Momentary measure of the meter / current power draw."""
+class Power(NamedTuple):
+    """Momentary measure of the meter / current power draw.
 
-    timestamp: datetime
+    A `NamedTuple` for the same reason and with the same caveats as `Delta`.
+    """
+
+    timestamp: Timestamp
+    """Time of the measurement, see `timestamp_dt` for a `datetime`."""
     value: Watt
 
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Time of the measurement as local `datetime`."""
+        return datetime.fromtimestamp(self.timestamp)
+
 
-@dataclass
+@dataclass(slots=True)
 class HistoricalMeterReading:
     """Power draw readings of the last hour, aggregated in 2 minutes."""
 
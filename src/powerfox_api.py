@@ -3,94 +3,229 @@ from model import (
     Device,
     Delta,
     EnergyFigures,
+    EnergyFiguresArray,
+    HistoricalDataArrays,
     HistoricalMeterReading,
     LiveMeterReading,
     Power,
 )
-import requests
+import httpx
+import orjson
+from array import array
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Literal, Optional, Any
+from math import nan
+from time import monotonic
+from typing import Callable, Literal, Optional, Any
 
 
 type JSON = dict[str, Any]
 
 
-class Parser:
-    """Helper class to parse the JSON responses of the API into Python objects."""
-
-    def parse_device(self, json: JSON) -> Device:
-        return Device(
-            account_associated_since=datetime.fromtimestamp(
-                json["AccountAssociatedSince"]
-            ),
-            id=json["DeviceId"],
-            division=json["Division"],
-            is_main_device=json["MainDevice"],
-            name=json["Name"],
-            prosumer=json["Prosumer"],
+# Parsers of the JSON responses of the API into Python objects.
+#
+# Objects are constructed with positional arguments in field order of the
+# respective dataclass in `model.py`, which skips keyword matching in the
+# generated constructor. Keep the order in sync when changing the models.
+
+
+def parse_device(json: JSON) -> Device:
+    return Device(
+        datetime.fromtimestamp(json["AccountAssociatedSince"]),
+        json["DeviceId"],
+        json["Division"],
+        json["MainDevice"],
+        json["Name"],
+        json["Prosumer"],
+    )
+
+
+def parse_energy_figures(json: JSON) -> EnergyFigures:
+    # hot loop: a report may hold thousands of deltas, hence they are built
+    # inline and globals are bound to locals
+    _Delta: type[Delta] = Delta
+    report_values: list[Delta] = [
+        _Delta(
+            d["Delta"],
+            d["Timestamp"],
+            d["Complete"],
+            d["DeltaCurrency"],
+            d["DeviceId"],
+            d["ValuesType"],
+            d.get("DeltaHT"),
+            d.get("DeltaNT"),
         )
+        for d in json["ReportValues"]
+    ]
+    return EnergyFigures(
+        json["Sum"],
+        json["Max"],
+        report_values,
+        datetime.fromtimestamp(json["StartTime"]),
+        json["StartTimeCurrency"],
+        json["SumCurrency"],
+        json["MaxCurrency"],
+        json["MeterReadings"],
+    )
+
+
+def parse_historical_data(json: JSON) -> HistoricalData:
+    return HistoricalData(
+        parse_energy_figures(json["Consumption"]),
+        parse_energy_figures(json["FeedIn"]),
+        parse_energy_figures(json["Generation"])
+        if "Generation" in json
+        else None,
+    )
+
+
+def parse_energy_figures_array(json: JSON) -> EnergyFiguresArray:
+    values: list[JSON] = json["ReportValues"]
+    return EnergyFiguresArray(
+        array("d", [d["Delta"] for d in values]),
+        array("q", [d["Timestamp"] for d in values]),
+        array("b", [d["Complete"] for d in values]),
+        array("d", [nan if (v := d.get("DeltaHT")) is None else v for d in values]),
+        array("d", [nan if (v := d.get("DeltaNT")) is None else v for d in values]),
+    )
+
+
+def parse_historical_data_arrays(json: JSON) -> HistoricalDataArrays:
+    return HistoricalDataArrays(
+        parse_energy_figures_array(json["Consumption"]),
+        parse_energy_figures_array(json["FeedIn"]),
+        parse_energy_figures_array(json["Generation"])
+        if "Generation" in json
+        else None,
+    )
+
+
+def parse_live_meterreading(json: JSON) -> LiveMeterReading:
+    return LiveMeterReading(
+        json["Watt"],
+        datetime.fromtimestamp(json["Timestamp"]),
+        json["A_Plus"],
+        json["A_Minus"],
+        json["Outdated"],
+        json.get("A_Plus_HT"),
+        json.get("A_Plus_NT"),
+    )
+
+
+def parse_historical_meterreading(json: JSON) -> HistoricalMeterReading:
+    # same as in `parse_energy_figures`: Power objects are built inline
+    _Power: type[Power] = Power
+    values: list[Power] = [_Power(v["Timestamp"], v["Value"]) for v in json["Values"]]
+    return HistoricalMeterReading(
+        json["Max"],
+        json["Min"],
+        values,
+        json["DeviceId"],
+        json["Avg"],
+    )
+
+
+def _is_final_report(json: JSON) -> bool:
+    """True if all deltas of a report were measured, i.e., none is estimated."""
+    return all(
+        d["Complete"]
+        for key in ("Consumption", "FeedIn", "Generation")
+        if key in json
+        for d in json[key]["ReportValues"]
+    )
+
+
+class _PowerfoxAPIBase:
+    """State, response cache and endpoint paths shared by both clients."""
+
+    max_cache_size = 128
+    """Maximum number of cached responses, least recently used are dropped."""
 
-    def parse_delta(self, json: JSON) -> Delta:
-        return Delta(
-            delta=json["Delta"],
-            timestamp=datetime.fromtimestamp(json["Timestamp"]),
-            complete=json["Complete"],
-            delta_currency=json["DeltaCurrency"],
-            device_id=json["DeviceId"],
-            values_type=json["ValuesType"],
-            delta_ht=json.get("DeltaHT") if "DeltaHT" in json else None,
-            delta_nt=json.get("DeltaNT") if "DeltaNT" in json else None,
-        )
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        *,
+        api_url: str = "https://backend.powerfox.energy/api/2.0",
+        cache: bool = True,
+    ):
+        self.username = username
+        self.password = password
+        self.api_url = api_url
+        self.cache = cache
+        self._cache: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
 
-    def parse_energy_figures(self, json: JSON) -> EnergyFigures:
-        return EnergyFigures(
-            sum=json["Sum"],
-            max=json["Max"],
-            report_values=[self.parse_delta(delta) for delta in json["ReportValues"]],
-            start_time=datetime.fromtimestamp(json["StartTime"]),
-            start_time_currency=json["StartTimeCurrency"],
-            sum_currency=json["SumCurrency"],
-            max_currency=json["MaxCurrency"],
-            meter_readings=json["MeterReadings"],
-        )
+    def _from_cache(self, url: str, ttl: Optional[float]) -> Optional[Any]:
+        """Return the cached response of `url` or None if missing or expired.
 
-    def parse_historical_data(self, json: JSON) -> HistoricalData:
-        return HistoricalData(
-            consumption=self.parse_energy_figures(json["Consumption"]),
-            feed_in=self.parse_energy_figures(json["FeedIn"]),
-            generation=self.parse_energy_figures(json["Generation"])
-            if "Generation" in json
-            else None,
-        )
+        `ttl=None` caches forever, `ttl=0` bypasses the cache.
+        """
+        if not self.cache or ttl == 0 or url not in self._cache:
+            return None
+        expires, json = self._cache[url]
+        if expires is None or expires > monotonic():
+            self._cache.move_to_end(url)
+            return json
+        del self._cache[url]
+        return None
+
+    def _to_cache(
+        self,
+        url: str,
+        ttl: Optional[float],
+        json: Any,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        """Cache the decoded response of `url` for `ttl` seconds.
+
+        Responses rejected by `cacheable` are not cached.
+        """
+        if not self.cache or ttl == 0 or (cacheable and not cacheable(json)):
+            return
+        self._cache[url] = (None if ttl is None else monotonic() + ttl, json)
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _report_ttl(day: Optional[date]) -> Optional[float]:
+        # reports of past days do not change anymore once all their deltas
+        # are measured (see `_is_final_report`) and can be cached forever
+        return None if day and day < date.today() else 0
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+
+    # Paths of the endpoints relative to `api_url`, shared by both clients.
+
+    _DEVICES_PATH = "/my/all/devices"
+    _DEVICES_TTL = 3600
+
+    @staticmethod
+    def _report_path(device_id: Optional[str], day: Optional[date]) -> str:
+        day_param = f"?year={day.year}&month={day.month}&day={day.day}" if day else ""
+        return f"/my/{device_id or 'main'}/report{day_param}"
 
-    def parse_live_meterreading(self, json: JSON) -> LiveMeterReading:
-        return LiveMeterReading(
-            watt=json["Watt"],
-            timestamp=datetime.fromtimestamp(json["Timestamp"]),
-            a_plus=json["A_Plus"],
-            a_minus=json["A_Minus"],
-            outdated=json["Outdated"],
-            a_plus_HT=json.get("A_Plus_HT") if "A_Plus_HT" in json else None,
-            a_plus_NT=json.get("A_Plus_NT") if "A_Plus_NT" in json else None,
-        )
+    @staticmethod
+    def _current_path(device_id: Optional[str], unit: Literal["Wh", "kWh"]) -> str:
+        unit_param = f"?unit={unit}" if unit == "kWh" else ""
+        return f"/my/{device_id or 'main'}/current{unit_param}"
 
-    def parse_power(self, json: JSON) -> Power:
-        return Power(
-            timestamp=datetime.fromtimestamp(json["Timestamp"]),
-            value=json["Value"],
-        )
+    @staticmethod
+    def _operating_path(device_id: Optional[str]) -> str:
+        return f"/my/{device_id or 'main'}/operating"
 
-    def parse_historical_meterreading(self, json: JSON) -> HistoricalMeterReading:
-        return HistoricalMeterReading(
-            max=json["Max"],
-            min=json["Min"],
-            values=[self.parse_power(reading) for reading in json["Values"]],
-            avg=json["Avg"],
-            device_id=json["DeviceId"],
-        )
+    @staticmethod
+    def _reportcsv_path(device_id: Optional[str]) -> str:
+        return f"/my/{device_id or 'main'}/reportcsv"
 
+    @staticmethod
+    def _operatingcsv_path(device_id: Optional[str]) -> str:
+        return f"/my/{device_id or 'main'}/operatingcsv"
 
-class PowerfoxAPI:
+
+class PowerfoxAPI(_PowerfoxAPIBase):
     """Python client to fetch the powerfox API.
 
     For detailed information about the API see `model.py` or the README.
@@ -107,6 +242,8 @@ class PowerfoxAPI:
         password: str,
         *,
         api_url: str = "https://backend.powerfox.energy/api/2.0",
+        cache: bool = True,
+        timeout: Optional[float] = None,
     ):
         """Initialize a new client.
 
@@ -115,19 +252,64 @@ class PowerfoxAPI:
             password (str): Password used in the Powerfox app.
             api_url (str, optional): API root URL.
                 Defaults to https://backend.powerfox.energy/api/2.0.
+            cache (bool, optional): Cache responses that (almost) never change,
+                i.e., the device list for an hour and reports of past days without
+                estimated deltas forever. At most `max_cache_size` responses are
+                kept. Cached raw JSON is shared between calls, so do not mutate it.
+                Defaults to True.
+            timeout (Optional[float], optional): Timeout of a request in seconds.
+                Defaults to None, i.e., wait until the API responds.
         """
-        self.username = username
-        self.password = password
-        self.api_url = api_url
-        self._parser = Parser()
+        super().__init__(username, password, api_url=api_url, cache=cache)
+
+        # reuse one pooled keep-alive HTTP/2 connection instead of a new TLS
+        # handshake per request; responses are gzip/brotli compressed
+        self._client = httpx.Client(
+            auth=(username, password),
+            base_url=api_url,
+            http2=True,
+            follow_redirects=True,
+            timeout=timeout,
+        )
+
+    def __enter__(self) -> "PowerfoxAPI":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        self._client.close()
+
+    def _get(
+        self,
+        path: str,
+        *,
+        ttl: Optional[float] = 0,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Fetch `path` and decode the JSON response, see `_to_cache` for caching."""
+        json = self._from_cache(path, ttl)
+        if json is not None:
+            return json
+
+        json = orjson.loads(self._get_content(path))
+
+        self._to_cache(path, ttl, json, cacheable)
+        return json
+
+    def _get_content(self, path: str) -> bytes:
+        """Fetch `path` and return the undecoded response body."""
+        response = self._client.get(path)
+        # only take the slower `raise_for_status` path on actual errors
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return response.content
 
     def get_devices_raw(self) -> list[JSON]:
         """Equivalent to `get_devices` but returns the raw JSON response."""
-        response = requests.get(
-            f"{self.api_url}/my/all/devices", auth=(self.username, self.password)
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(self._DEVICES_PATH, ttl=self._DEVICES_TTL)
 
     def get_devices(self) -> list[Device]:
         """Get a list of devices associated with your account.
@@ -139,7 +321,7 @@ class PowerfoxAPI:
             list[Device]: The list of devices.
         """
         json = self.get_devices_raw()
-        return [self._parser.parse_device(device) for device in json]
+        return [parse_device(device) for device in json]
 
     def get_historical_data_raw(
         self,
@@ -148,15 +330,11 @@ class PowerfoxAPI:
         day: Optional[date] = None,
     ) -> JSON:
         """Equivalent to `get_historical_data` but returns the raw JSON response."""
-        device_id = device_id or "main"
-        day_param = f"?year={day.year}&month={day.month}&day={day.day}" if day else ""
-
-        response = requests.get(
-            f"{self.api_url}/my/{device_id}/report{day_param}",
-            auth=(self.username, self.password),
+        return self._get(
+            self._report_path(device_id, day),
+            ttl=self._report_ttl(day),
+            cacheable=_is_final_report,
         )
-        response.raise_for_status()
-        return response.json()
 
     def get_historical_data(
         self,
@@ -183,7 +361,31 @@ class PowerfoxAPI:
             HistoricalData: The historical data.
         """
         json = self.get_historical_data_raw(device_id=device_id, day=day)
-        return self._parser.parse_historical_data(json)
+        return parse_historical_data(json)
+
+    def get_historical_data_arrays(
+        self,
+        device_id: Optional[str] = None,
+        *,
+        day: Optional[date] = None,
+    ) -> HistoricalDataArrays:
+        """Equivalent to `get_historical_data` but returns the deltas column-wise.
+
+        Avoids creating a `Delta` object per interval, which is preferable for
+        large reports that are only aggregated or plotted.
+        See `EnergyFiguresArray` for details.
+
+        Args:
+            device_id (Optional[str], optional): Specific device, otherwise main device.
+            Defaults to None.
+            day (Optional[date], optional): Specific date, otherwise last 24h.
+            Defaults to None.
+
+        Returns:
+            HistoricalDataArrays: The historical data as columns.
+        """
+        json = self.get_historical_data_raw(device_id=device_id, day=day)
+        return parse_historical_data_arrays(json)
 
     def get_live_meterreading_raw(
         self,
@@ -192,14 +394,7 @@ class PowerfoxAPI:
         unit: Literal["Wh", "kWh"] = "Wh",
     ) -> JSON:
         """Equivalent to `get_live_meterreading` but returns the raw JSON response."""
-        device_id = device_id or "main"
-        unit_param = f"?unit={unit}" if unit == "kWh" else ""
-        response = requests.get(
-            f"{self.api_url}/my/{device_id}/current{unit_param}",
-            auth=(self.username, self.password),
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(self._current_path(device_id, unit))
 
     def get_live_meterreading(
         self,
@@ -220,17 +415,11 @@ class PowerfoxAPI:
             LiveMeterReading: The live meter reading (current power draw).
         """
         json = self.get_live_meterreading_raw(device_id=device_id, unit=unit)
-        return self._parser.parse_live_meterreading(json)
+        return parse_live_meterreading(json)
 
     def get_historical_meterreading_raw(self, device_id: Optional[str] = None) -> JSON:
         """Equivalent to `get_historical_meterreading` but returns the raw JSON response."""
-        device_id = device_id or "main"
-        response = requests.get(
-            f"{self.api_url}/my/{device_id}/operating",
-            auth=(self.username, self.password),
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(self._operating_path(device_id))
 
     def get_historical_meterreading(
         self, device_id: Optional[str] = None
@@ -247,4 +436,204 @@ class PowerfoxAPI:
             HistoricalMeterReading: Historical meter readings (power draw over time).
         """
         json = self.get_historical_meterreading_raw(device_id=device_id)
-        return self._parser.parse_historical_meterreading(json)
+        return parse_historical_meterreading(json)
+
+    def get_historical_data_csv(self, device_id: Optional[str] = None) -> bytes:
+        """Get 15-minute deltas of the last 31 days as CSV file.
+
+        The CSV is returned unparsed, so that it can directly be read into a
+        columnar format without creating an object per row, e.g.:
+
+        >>> from pyarrow import BufferReader, csv
+        >>> content = api.get_historical_data_csv(device.id)
+        >>> table = csv.read_csv(
+        ...     BufferReader(content), parse_options=csv.ParseOptions(delimiter=";")
+        ... )
+
+        Args:
+            device_id (Optional[str], optional): Specific device. Defaults to None.
+
+        Returns:
+            bytes: The CSV file.
+        """
+        return self._get_content(self._reportcsv_path(device_id))
+
+    def get_historical_meterreading_csv(self, device_id: Optional[str] = None) -> bytes:
+        """Get the power draw readings of the last 7 days as CSV file.
+
+        The CSV is returned unparsed, see `get_historical_data_csv`.
+
+        Args:
+            device_id (Optional[str], optional): Specific device. Defaults to None.
+
+        Returns:
+            bytes: The CSV file.
+        """
+        return self._get_content(self._operatingcsv_path(device_id))
+
+
+class AsyncPowerfoxAPI(_PowerfoxAPIBase):
+    """Asynchronous variant of `PowerfoxAPI`.
+
+    Requests are multiplexed over a single HTTP/2 connection, so data of
+    several devices can be fetched concurrently.
+
+    Examples:
+    >>> async with AsyncPowerfoxAPI("username", "password") as api:
+    ...     devices = await api.get_devices()
+    ...     readings = await asyncio.gather(
+    ...         *[api.get_live_meterreading(device.id) for device in devices]
+    ...     )
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        *,
+        api_url: str = "https://backend.powerfox.energy/api/2.0",
+        cache: bool = True,
+        timeout: Optional[float] = None,
+    ):
+        """Initialize a new client.
+
+        Args:
+            username (str): Username used in the Powerfox app.
+            password (str): Password used in the Powerfox app.
+            api_url (str, optional): API root URL.
+                Defaults to https://backend.powerfox.energy/api/2.0.
+            cache (bool, optional): Cache responses that (almost) never change,
+                i.e., the device list for an hour and reports of past days without
+                estimated deltas forever. At most `max_cache_size` responses are
+                kept. Cached raw JSON is shared between calls, so do not mutate it.
+                Defaults to True.
+            timeout (Optional[float], optional): Timeout of a request in seconds.
+                Defaults to None, i.e., wait until the API responds.
+        """
+        super().__init__(username, password, api_url=api_url, cache=cache)
+        self._client = httpx.AsyncClient(
+            auth=(username, password),
+            base_url=api_url,
+            http2=True,
+            follow_redirects=True,
+            timeout=timeout,
+        )
+
+    async def __aenter__(self) -> "AsyncPowerfoxAPI":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
+
+    async def _get(
+        self,
+        path: str,
+        *,
+        ttl: Optional[float] = 0,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Fetch `path` and decode the JSON response, see `_to_cache` for caching."""
+        json = self._from_cache(path, ttl)
+        if json is not None:
+            return json
+
+        json = orjson.loads(await self._get_content(path))
+
+        self._to_cache(path, ttl, json, cacheable)
+        return json
+
+    async def _get_content(self, path: str) -> bytes:
+        """Fetch `path` and return the undecoded response body."""
+        response = await self._client.get(path)
+        # only take the slower `raise_for_status` path on actual errors
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return response.content
+
+    async def get_devices_raw(self) -> list[JSON]:
+        """Equivalent to `get_devices` but returns the raw JSON response."""
+        return await self._get(self._DEVICES_PATH, ttl=self._DEVICES_TTL)
+
+    async def get_devices(self) -> list[Device]:
+        """See `PowerfoxAPI.get_devices`."""
+        json = await self.get_devices_raw()
+        return [parse_device(device) for device in json]
+
+    async def get_historical_data_raw(
+        self,
+        device_id: Optional[str] = None,
+        *,
+        day: Optional[date] = None,
+    ) -> JSON:
+        """Equivalent to `get_historical_data` but returns the raw JSON response."""
+        return await self._get(
+            self._report_path(device_id, day),
+            ttl=self._report_ttl(day),
+            cacheable=_is_final_report,
+        )
+
+    async def get_historical_data(
+        self,
+        device_id: Optional[str] = None,
+        *,
+        day: Optional[date] = None,
+    ) -> HistoricalData:
+        """See `PowerfoxAPI.get_historical_data`."""
+        json = await self.get_historical_data_raw(device_id=device_id, day=day)
+        return parse_historical_data(json)
+
+    async def get_historical_data_arrays(
+        self,
+        device_id: Optional[str] = None,
+        *,
+        day: Optional[date] = None,
+    ) -> HistoricalDataArrays:
+        """See `PowerfoxAPI.get_historical_data_arrays`."""
+        json = await self.get_historical_data_raw(device_id=device_id, day=day)
+        return parse_historical_data_arrays(json)
+
+    async def get_live_meterreading_raw(
+        self,
+        device_id: Optional[str] = None,
+        *,
+        unit: Literal["Wh", "kWh"] = "Wh",
+    ) -> JSON:
+        """Equivalent to `get_live_meterreading` but returns the raw JSON response."""
+        return await self._get(self._current_path(device_id, unit))
+
+    async def get_live_meterreading(
+        self,
+        device_id: Optional[str] = None,
+        *,
+        unit: Literal["Wh", "kWh"] = "Wh",
+    ) -> LiveMeterReading:
+        """See `PowerfoxAPI.get_live_meterreading`."""
+        json = await self.get_live_meterreading_raw(device_id=device_id, unit=unit)
+        return parse_live_meterreading(json)
+
+    async def get_historical_meterreading_raw(
+        self, device_id: Optional[str] = None
+    ) -> JSON:
+        """Equivalent to `get_historical_meterreading` but returns the raw JSON response."""
+        return await self._get(self._operating_path(device_id))
+
+    async def get_historical_meterreading(
+        self, device_id: Optional[str] = None
+    ) -> HistoricalMeterReading:
+        """See `PowerfoxAPI.get_historical_meterreading`."""
+        json = await self.get_historical_meterreading_raw(device_id=device_id)
+        return parse_historical_meterreading(json)
+
+    async def get_historical_data_csv(self, device_id: Optional[str] = None) -> bytes:
+        """See `PowerfoxAPI.get_historical_data_csv`."""
+        return await self._get_content(self._reportcsv_path(device_id))
+
+    async def get_historical_meterreading_csv(
+        self, device_id: Optional[str] = None
+    ) -> bytes:
+        """See `PowerfoxAPI.get_historical_meterreading_csv`."""
+        return await self._get_content(self._operatingcsv_path(device_id))